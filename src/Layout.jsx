@@ -1,10 +1,62 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useMemo, lazy, Suspense } from "react";
 import Home from "./tabs/Home.jsx";
-import CadApp from "./tabs/CadApp.jsx";
 import About from "./tabs/About.jsx";
 
+// The CAD app pulls in three.js, replicad and the OpenCascade worker, so it
+// is only loaded the first time its tab is opened
+const loadCadApp = () => import("./tabs/CadApp.jsx");
+
+const centeredMessageStyle = {
+  flex: 1,
+  display: "flex",
+  flexDirection: "column",
+  alignItems: "center",
+  justifyContent: "center",
+  gap: "0.75rem",
+  color: "#999"
+};
+
+// Shows a retry prompt instead of unmounting the whole layout when the
+// CAD app chunk fails to load (network error, stale chunk after a redeploy)
+class LazyLoadBoundary extends React.Component {
+  constructor(props) {
+    super(props);
+    this.state = { error: null };
+  }
+
+  static getDerivedStateFromError(error) {
+    return { error };
+  }
+
+  render() {
+    if (this.state.error) {
+      return (
+        <div style={centeredMessageStyle}>
+          <span>Failed to load the CAD app.</span>
+          <button
+            onClick={this.props.onRetry}
+            style={{
+              padding: "0.5rem 1rem",
+              borderRadius: "0.25rem",
+              border: "1px solid #ccc",
+              background: "#f0f0f0",
+              cursor: "pointer"
+            }}
+          >
+            Retry
+          </button>
+        </div>
+      );
+    }
+    return this.props.children;
+  }
+}
+
 export default function Layout() {
   const [activeTab, setActiveTab] = useState("home");
+  // Each retry gets a fresh lazy component so the import is attempted again
+  const [cadAppAttempt, setCadAppAttempt] = useState(0);
+  const CadApp = useMemo(() => lazy(loadCadApp), [cadAppAttempt]);
 
   // Define a clean tab switching function
   const switchTab = (tab) => {
@@ -128,7 +180,20 @@ export default function Layout() {
           <Home />
         </div>
       )}
-      {activeTab === "app" && <CadApp />}
+      {activeTab === "app" && (
+        <LazyLoadBoundary
+          key={cadAppAttempt}
+          onRetry={() => setCadAppAttempt(attempt => attempt + 1)}
+        >
+          <Suspense fallback={
+            <div style={centeredMessageStyle}>
+              Loading CAD app...
+            </div>
+          }>
+            <CadApp />
+          </Suspense>
+        </LazyLoadBoundary>
+      )}
       {activeTab === "about" && (
         <div style={{ flex: 1, overflow: "auto" }}>
           <About />
@@ -1,5 +1,5 @@
 // RenderingView.jsx
-import React, { useRef, useState, useEffect, Suspense } from "react";
+import React, { useRef, useState, useEffect, useMemo, Suspense } from "react";
 import { Canvas, useThree } from "@react-three/fiber";
 import { OrbitControls, Environment } from "@react-three/drei";
 import * as THREE from "three";
@@ -93,6 +93,18 @@ function FloorGrid({ modelSize = 100 }) {
 
 // Model component to render the actual 3D content
 function ModelDisplay({ mesh, highQuality, modelId }) {
+  // Copy the mesh into typed arrays once per mesh, not on every render
+  const buffers = useMemo(() => {
+    if (!mesh) return null;
+    const { faces, edges } = mesh;
+    return {
+      positions: faces && faces.vertices ? new Float32Array(faces.vertices) : null,
+      normals: faces && faces.normals ? new Float32Array(faces.normals) : null,
+      indices: faces && faces.triangles ? new Uint32Array(faces.triangles) : null,
+      edgePositions: edges && edges.vertices ? new Float32Array(edges.vertices) : null
+    };
+  }, [mesh]);
+  
   if (!mesh || !mesh.faces) return null;
   
   return (
@@ -104,19 +116,19 @@ function ModelDisplay({ mesh, highQuality, modelId }) {
             <bufferAttribute
               attach="attributes-position"
               count={mesh.faces.vertices.length / 3}
-              array={new Float32Array(mesh.faces.vertices)}
+              array={buffers.positions}
               itemSize={3}
             />
             <bufferAttribute
               attach="attributes-normal"
               count={mesh.faces.normals.length / 3}
-              array={new Float32Array(mesh.faces.normals)}
+              array={buffers.normals}
               itemSize={3}
             />
             <bufferAttribute
               attach="index"
               count={mesh.faces.triangles.length}
-              array={new Uint32Array(mesh.faces.triangles)}
+              array={buffers.indices}
               itemSize={1}
             />
           </bufferGeometry>
@@ -137,7 +149,7 @@ function ModelDisplay({ mesh, highQuality, modelId }) {
             <bufferAttribute
               attach="attributes-position"
               count={mesh.edges.vertices.length / 3}
-              array={new Float32Array(mesh.edges.vertices)}
+              array={buffers.edgePositions}
               itemSize={3}
             />
           </bufferGeometry>
@@ -188,7 +200,7 @@ export default function RenderingView({ mesh, isMobile }) {
   const [highQuality, setHighQuality] = useState(!isMobile);
   const [modelId, setModelId] = useState(Date.now()); // Unique ID for the current model
   
-  // Update model ID when mesh changes to force scene re-creation
+  // Update model ID when mesh changes to force geometry re-creation
   useEffect(() => {
     setModelId(Date.now());
   }, [mesh]);
@@ -199,25 +211,26 @@ export default function RenderingView({ mesh, isMobile }) {
       try {
         // Calculate approximate size from vertices
         const vertices = mesh.faces.vertices;
-        if (vertices && vertices.length > 0) {
-          const xValues = [];
-          const yValues = [];
-          const zValues = [];
+        if (vertices && vertices.length >= 3) {
+          // Track bounds in a single pass instead of copying every
+          // coordinate into per-axis arrays and spreading them
+          let minX = Infinity, minY = Infinity, minZ = Infinity;
+          let maxX = -Infinity, maxY = -Infinity, maxZ = -Infinity;
           
           for (let i = 0; i < vertices.length; i += 3) {
-            xValues.push(vertices[i]);
-            yValues.push(vertices[i + 1]);
-            zValues.push(vertices[i + 2]);
+            const x = vertices[i];
+            const y = vertices[i + 1];
+            const z = vertices[i + 2];
+            if (x < minX) minX = x;
+            if (x > maxX) maxX = x;
+            if (y < minY) minY = y;
+            if (y > maxY) maxY = y;
+            if (z < minZ) minZ = z;
+            if (z > maxZ) maxZ = z;
           }
           
-          if (xValues.length > 0 && yValues.length > 0 && zValues.length > 0) {
-            const xRange = Math.max(...xValues) - Math.min(...xValues);
-            const yRange = Math.max(...yValues) - Math.min(...yValues);
-            const zRange = Math.max(...zValues) - Math.min(...zValues);
-            
-            const maxDimension = Math.max(xRange, yRange, zRange);
-            setModelSize(maxDimension > 0 ? maxDimension : 100);
-          }
+          const maxDimension = Math.max(maxX - minX, maxY - minY, maxZ - minZ);
+          setModelSize(maxDimension > 0 ? maxDimension : 100);
         }
       } catch (error) {
         console.error("Error calculating model size:", error);
@@ -231,9 +244,12 @@ export default function RenderingView({ mesh, isMobile }) {
   
   return (
     <div style={{ width: "100%", height: "100%", position: "relative" }}>
-      {/* Use key to force canvas recreation when model changes */}
+      {/* Keep one canvas (and WebGL context) alive across model changes; */}
+      {/* ModelDisplay is keyed by modelId so only the geometry is rebuilt. */}
+      {/* The context is recreated only when the quality setting changes, */}
+      {/* since antialias and precision are fixed at context creation */}
       <Canvas
-        key={`canvas-${modelId}`}
+        key={highQuality ? "hq" : "lq"}
         style={{
           width: "100%",
           height: "100%",
@@ -313,7 +329,7 @@ export default function RenderingView({ mesh, isMobile }) {
             max="5"
             step="0.1"
             value={rotationSpeed}
-            onChange={(e) => setRotationSpeed(parseFloat(e.target.value))}
+            onChange={(e) => setRotationSpeed(e.target.valueAsNumber)}
             style={{
               width: isMobile ? "80px" : "100px"
             }}
@@ -6,6 +6,38 @@ import {
   syncLines,
   syncLinesFromFaces,
 } from "replicad-threejs-helper";
+import { perfTime, perfTimeEnd } from "./helpers/perf.js";
+
+// Enhanced material settings for high quality rendering
+const HIGH_QUALITY_BODY_MATERIAL = {
+  color: "#6a92a6",
+  metalness: 0.4,
+  roughness: 0.3,
+  envMapIntensity: 0.8,
+  flatShading: false,
+  polygonOffset: true,
+  polygonOffsetFactor: 2.0,
+  polygonOffsetUnits: 1.0,
+  castShadow: true,
+  receiveShadow: true
+};
+
+const BODY_MATERIAL = {
+  color: "#5a8296",
+  polygonOffset: true,
+  polygonOffsetFactor: 2.0,
+  polygonOffsetUnits: 1.0
+};
+
+// Enhanced line material for high quality
+const HIGH_QUALITY_LINE_MATERIAL = {
+  color: "#304352",
+  linewidth: 1.5
+};
+
+const LINE_MATERIAL = {
+  color: "#3c5a6e"
+};
 
 export default React.memo(function ShapeMeshes({ faces, edges, helperSpaces = [], highQuality = false }) {
   const { invalidate } = useThree();
@@ -35,9 +67,9 @@ export default React.memo(function ShapeMeshes({ faces, edges, helperSpaces = []
     // Main model
     if (faces) {
       try {
-        console.time('[PERF] syncFaces');
+        perfTime('syncFaces');
         syncFaces(body.current, faces);
-        console.timeEnd('[PERF] syncFaces');
+        perfTimeEnd('syncFaces');
       } catch (error) {
         console.error('[ERROR] Error in syncFaces:', error);
       }
@@ -45,17 +77,17 @@ export default React.memo(function ShapeMeshes({ faces, edges, helperSpaces = []
 
     if (edges) {
       try {
-        console.time('[PERF] syncLines');
+        perfTime('syncLines');
         syncLines(lines.current, edges);
-        console.timeEnd('[PERF] syncLines');
+        perfTimeEnd('syncLines');
       } catch (error) {
         console.error('[ERROR] Error in syncLines:', error);
       }
     } else if (faces) {
       try {
-        console.time('[PERF] syncLinesFromFaces');
+        perfTime('syncLinesFromFaces');
         syncLinesFromFaces(lines.current, body.current);
-        console.timeEnd('[PERF] syncLinesFromFaces');
+        perfTimeEnd('syncLinesFromFaces');
       } catch (error) {
         console.error('[ERROR] Error in syncLinesFromFaces:', error);
       }
@@ -89,42 +121,14 @@ export default React.memo(function ShapeMeshes({ faces, edges, helperSpaces = []
     };
   }, [helperGeometries]);
 
-  // Enhanced material settings for high quality rendering
-  const bodyMaterial = highQuality ? {
-    color: "#6a92a6",
-    metalness: 0.4,
-    roughness: 0.3,
-    envMapIntensity: 0.8,
-    flatShading: false,
-    polygonOffset: true,
-    polygonOffsetFactor: 2.0,
-    polygonOffsetUnits: 1.0,
-    castShadow: true,
-    receiveShadow: true
-  } : {
-    color: "#5a8296",
-    polygonOffset: true,
-    polygonOffsetFactor: 2.0,
-    polygonOffsetUnits: 1.0
-  };
-
-  // Enhanced line material for high quality
-  const lineMaterial = highQuality ? {
-    color: "#304352",
-    linewidth: 1.5
-  } : {
-    color: "#3c5a6e"
-  };
+  const bodyMaterial = highQuality ? HIGH_QUALITY_BODY_MATERIAL : BODY_MATERIAL;
+  const lineMaterial = highQuality ? HIGH_QUALITY_LINE_MATERIAL : LINE_MATERIAL;
 
   return (
     <group>
       {/* Main model */}
       <mesh geometry={body.current} castShadow receiveShadow>
-        {highQuality ? (
-          <meshStandardMaterial {...bodyMaterial} />
-        ) : (
-          <meshStandardMaterial {...bodyMaterial} />
-        )}
+        <meshStandardMaterial {...bodyMaterial} />
       </mesh>
       <lineSegments geometry={lines.current}>
         <lineBasicMaterial {...lineMaterial} />
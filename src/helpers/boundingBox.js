@@ -32,25 +32,31 @@ export const EDGES = {
   RIGHT_BOTTOM: "right_bottom",   // Edge between RIGHT and BOTTOM faces
 };
 
+/**
+ * Normal direction of each bounding box face
+ */
+const FACE_NORMALS = new Map([
+  [FACES.FRONT, [0, -1, 0]],
+  [FACES.BACK, [0, 1, 0]],
+  [FACES.LEFT, [-1, 0, 0]],
+  [FACES.RIGHT, [1, 0, 0]],
+  [FACES.TOP, [0, 0, 1]],
+  [FACES.BOTTOM, [0, 0, -1]],
+]);
+
 /**
  * Get the normal vector for a specific face of a bounding box
  * @param {string} face - Face identifier (one of FACES constants)
  * @returns {Vector} Normal vector for the face
  */
 export function getFaceNormal(face) {
-  let normal;
-  switch (face) {
-    case FACES.FRONT: normal = new Vector([0, -1, 0]); break;
-    case FACES.BACK: normal = new Vector([0, 1, 0]); break;
-    case FACES.LEFT: normal = new Vector([-1, 0, 0]); break;
-    case FACES.RIGHT: normal = new Vector([1, 0, 0]); break;
-    case FACES.TOP: normal = new Vector([0, 0, 1]); break;
-    case FACES.BOTTOM: normal = new Vector([0, 0, -1]); break;
-    default: 
-      throw new Error(`Unknown face identifier: ${face}`);
+  const normal = FACE_NORMALS.get(face);
+  if (!normal) {
+    throw new Error(`Unknown face identifier: ${face}`);
   }
   
-  return normal;
+  // Callers own (and may delete) the returned Vector, so always build a new one
+  return new Vector(normal);
 }
 
 /**
@@ -103,11 +109,16 @@ export function getFaceFromNormal(normal) {
   const x = norm.x;
   const y = norm.y;
   const z = norm.z;
+  norm.delete();
+  
+  const absX = Math.abs(x);
+  const absY = Math.abs(y);
+  const absZ = Math.abs(z);
   
   let result;
-  if (Math.abs(x) > Math.abs(y) && Math.abs(x) > Math.abs(z)) {
+  if (absX > absY && absX > absZ) {
     result = x > 0 ? FACES.RIGHT : FACES.LEFT;
-  } else if (Math.abs(y) > Math.abs(x) && Math.abs(y) > Math.abs(z)) {
+  } else if (absY > absX && absY > absZ) {
     result = y > 0 ? FACES.BACK : FACES.FRONT;
   } else {
     result = z > 0 ? FACES.TOP : FACES.BOTTOM;
@@ -274,6 +285,16 @@ export function getEdgeConnectingFaces(edge) {
   }
 }
 
+/**
+ * Edge identifiers keyed by their two connecting faces, in either order
+ */
+const EDGES_BY_FACES = new Map(
+  Object.values(EDGES).flatMap(edge => {
+    const [f1, f2] = getEdgeConnectingFaces(edge);
+    return [[`${f1}|${f2}`, edge], [`${f2}|${f1}`, edge]];
+  })
+);
+
 /**
  * Find the edge identifier from two connected face identifiers
  * @param {string} face1 - First face identifier (one of FACES constants)
@@ -286,27 +307,9 @@ export function getEdgeFromFaces(face1, face2) {
     throw new Error("Cannot find edge between same face");
   }
   
-  // Store valid pairs in a concise format
-  const validPairs = [
-    [FACES.FRONT, FACES.LEFT, EDGES.FRONT_LEFT],
-    [FACES.FRONT, FACES.RIGHT, EDGES.FRONT_RIGHT],
-    [FACES.FRONT, FACES.TOP, EDGES.FRONT_TOP],
-    [FACES.FRONT, FACES.BOTTOM, EDGES.FRONT_BOTTOM],
-    [FACES.BACK, FACES.LEFT, EDGES.BACK_LEFT],
-    [FACES.BACK, FACES.RIGHT, EDGES.BACK_RIGHT],
-    [FACES.BACK, FACES.TOP, EDGES.BACK_TOP],
-    [FACES.BACK, FACES.BOTTOM, EDGES.BACK_BOTTOM],
-    [FACES.LEFT, FACES.TOP, EDGES.LEFT_TOP],
-    [FACES.LEFT, FACES.BOTTOM, EDGES.LEFT_BOTTOM],
-    [FACES.RIGHT, FACES.TOP, EDGES.RIGHT_TOP],
-    [FACES.RIGHT, FACES.BOTTOM, EDGES.RIGHT_BOTTOM]
-  ];
-  
-  // Find the matching pair (in either order)
-  for (const [f1, f2, edge] of validPairs) {
-    if ((f1 === face1 && f2 === face2) || (f1 === face2 && f2 === face1)) {
-      return edge;
-    }
+  const edge = EDGES_BY_FACES.get(`${face1}|${face2}`);
+  if (edge) {
+    return edge;
   }
   
   throw new Error(`No edge connects faces ${face1} and ${face2}`);
@@ -419,12 +422,10 @@ export function getPointOnBoundingBox(boundingBox, position) {
       return getPointOnEdge(boundingBox, element, params.t);
     case 'corner':
       // Corners are just the start or end points of edges
-      if (element.includes('START')) {
-        const edgeName = element.replace('_START', '');
-        return getEdgeStartPoint(boundingBox, edgeName);
-      } else if (element.includes('END')) {
-        const edgeName = element.replace('_END', '');
-        return getEdgeEndPoint(boundingBox, edgeName);
+      if (element.endsWith('_START')) {
+        return getEdgeStartPoint(boundingBox, element.slice(0, -'_START'.length));
+      } else if (element.endsWith('_END')) {
+        return getEdgeEndPoint(boundingBox, element.slice(0, -'_END'.length));
       } else {
         throw new Error(`Invalid corner identifier: ${element}`);
       }
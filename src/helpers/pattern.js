@@ -29,25 +29,33 @@ export function combine(...modelGenerators) {
  */
 export function createRectangularGrid(gridPlane, rowCount, colCount, xSpacing, ySpacing, orientationX = 0, orientationY = 0, orientationZ = 1) {
   const orientationVector = new Vector([orientationX, orientationY, orientationZ]).normalized();
+  const orientation = [orientationVector.x, orientationVector.y, orientationVector.z];
   
-  return Array.from({ length: rowCount * colCount }, (_, index) => {
+  // The grid plane is the same for every point, so build it once
+  const plane = new Plane(
+    new Vector(gridPlane.origin),
+    new Vector(gridPlane.xDirection).normalized(),
+    new Vector(gridPlane.normal).normalized()
+  );
+  
+  const points = Array.from({ length: rowCount * colCount }, (_, index) => {
     const row = Math.floor(index / colCount);
     const col = index % colCount;
     const x = col * xSpacing;
     const y = row * ySpacing;
-    // Create plane inline for single return statement
-    const plane = new Plane(
-      new Vector(gridPlane.origin),
-      new Vector(gridPlane.xDirection).normalized(),
-      new Vector(gridPlane.normal).normalized()
-    );
     const worldPoint = plane.toWorldCoords([x, y, 0]);
+    const position = [worldPoint.x, worldPoint.y, worldPoint.z];
+    worldPoint.delete();
     return {
-      position: [worldPoint.x, worldPoint.y, worldPoint.z],
+      position,
       direction: [gridPlane.normal[0], gridPlane.normal[1], gridPlane.normal[2]],
-      orientation: [orientationVector.x, orientationVector.y, orientationVector.z]
+      orientation: [...orientation]
     };
   });
+  
+  plane.delete();
+  orientationVector.delete();
+  return points;
 }
 
 /**
@@ -0,0 +1,21 @@
+// helpers/perf.js
+// Console timers for [PERF] measurements
+
+// Timings are only reported in development builds
+const enabled = import.meta.env.DEV;
+
+/**
+ * Start a [PERF] console timer (no-op outside development)
+ * @param {string} label - Timer label, without the [PERF] prefix
+ */
+export function perfTime(label) {
+  if (enabled) console.time(`[PERF] ${label}`);
+}
+
+/**
+ * Stop a [PERF] console timer and report its duration (no-op outside development)
+ * @param {string} label - Timer label, without the [PERF] prefix
+ */
+export function perfTimeEnd(label) {
+  if (enabled) console.timeEnd(`[PERF] ${label}`);
+}
@@ -12,29 +12,30 @@ import { centerSelector } from './selectors.js';
  * @returns {Array<Object>} Array of positioned and oriented models
  */
 export function placeModelsAtPoints(modelCreator, referenceSelector, pointsWithOrientation) {
-  return pointsWithOrientation.map(({ position, direction, orientation }) => {
-    const model = modelCreator();
-    const refPoint = referenceSelector(model);
-    
+  // Build the model and its reference point once; every placement works on a clone
+  const template = modelCreator();
+  const refPoint = referenceSelector(template);
+  const defaultDirection = new Vector([0, 0, 1]); // Assuming model's default orientation
+  
+  const placedModels = pointsWithOrientation.map(({ position, direction, orientation }) => {
     // First translate the model to the target position
-    let transformedModel = model.translate([
+    let transformedModel = template.clone().translate([
       position[0] - refPoint[0],
       position[1] - refPoint[1],
       position[2] - refPoint[2]
     ]);
     
     // Then rotate to align with the orientation
-    const defaultDirection = [0, 0, 1]; // Assuming model's default orientation
     const orientationVec = new Vector(orientation || direction); // Use orientation if provided, otherwise fall back to direction
     
     if (orientationVec.Length > 0) {
-      const rotationAxis = new Vector(defaultDirection).cross(orientationVec);
+      const rotationAxis = defaultDirection.cross(orientationVec);
       
       // Only rotate if needed (vectors aren't parallel)
       if (rotationAxis.Length > 1e-10) {
-        const angle = new Vector(defaultDirection).getAngle(orientationVec);
+        const angle = defaultDirection.getAngle(orientationVec);
         transformedModel = transformedModel.rotate(angle, position, rotationAxis);
-      } else if (orientationVec.dot(new Vector(defaultDirection)) < 0) {
+      } else if (orientationVec.dot(defaultDirection) < 0) {
         // Vectors are anti-parallel, rotate 180° around any perpendicular axis
         transformedModel = transformedModel.rotate(180, position, [1, 0, 0]);
       }
@@ -42,5 +43,8 @@ export function placeModelsAtPoints(modelCreator, referenceSelector, pointsWithO
     
     return transformedModel;
   });
+  
+  template.delete();
+  return placedModels;
 }
 
@@ -21,12 +21,13 @@ export function createOrthographicProjections(model) {
   
   // If the model has separate components (like helperCuboid)
   if (model && model.main && Array.isArray(model.helperSpaces)) {
+    // The main component is the model already projected above
     partProjections = [{
       name: "Main Component",
       views: {
-        front: drawProjection(model.main, "front"),
-        top: drawProjection(model.main, "top"),
-        right: drawProjection(model.main, "right")
+        front: frontView,
+        top: topView,
+        right: rightView
       }
     }];
     
@@ -63,22 +64,7 @@ export function processProjectionsForRendering(projections) {
   
   // Process standard views
   for (const [viewName, view] of Object.entries(projections.standard)) {
-    // Process each view to get SVG path data
-    processedViews[viewName] = {
-      visible: {
-        paths: view.visible.toSVGPaths(),
-        viewBox: view.visible.toSVGViewBox(2)
-      },
-      hidden: {
-        paths: view.hidden.toSVGPaths(),
-        viewBox: view.hidden.toSVGViewBox(2)
-      },
-      // Combine both viewboxes to ensure consistent scaling
-      combinedViewBox: combineViewBoxes(
-        view.visible.toSVGViewBox(2), 
-        view.hidden.toSVGViewBox(2)
-      )
-    };
+    processedViews[viewName] = processView(view);
   }
   
   // Process part views if available
@@ -86,20 +72,7 @@ export function processProjectionsForRendering(projections) {
   for (const part of projections.parts) {
     const views = {};
     for (const [viewName, view] of Object.entries(part.views)) {
-      views[viewName] = {
-        visible: {
-          paths: view.visible.toSVGPaths(),
-          viewBox: view.visible.toSVGViewBox(2)
-        },
-        hidden: {
-          paths: view.hidden.toSVGPaths(),
-          viewBox: view.hidden.toSVGViewBox(2)
-        },
-        combinedViewBox: combineViewBoxes(
-          view.visible.toSVGViewBox(2), 
-          view.hidden.toSVGViewBox(2)
-        )
-      };
+      views[viewName] = processView(view);
     }
     
     processedParts.push({
@@ -114,6 +87,50 @@ export function processProjectionsForRendering(projections) {
   };
 }
 
+/**
+ * Converts a single projection view to SVG path data
+ * @param {Object} view - A view with visible and hidden drawings
+ * @returns {Object} Paths and viewBoxes for the view
+ */
+function processView(view) {
+  // Each viewBox is computed once and reused for the combined viewBox
+  const visibleViewBox = view.visible.toSVGViewBox(2);
+  const hiddenViewBox = view.hidden.toSVGViewBox(2);
+  
+  return {
+    visible: {
+      paths: view.visible.toSVGPaths(),
+      viewBox: visibleViewBox
+    },
+    hidden: {
+      paths: view.hidden.toSVGPaths(),
+      viewBox: hiddenViewBox
+    },
+    // Combine both viewboxes to ensure consistent scaling
+    combinedViewBox: combineViewBoxes(visibleViewBox, hiddenViewBox)
+  };
+}
+
+/**
+ * Parses a viewBox string "x y width height"
+ * @param {string} vb - viewBox string
+ * @returns {Object|null} Parsed box, or null if empty/invalid
+ */
+function parseViewBox(vb) {
+  if (!vb) return null;
+  const parts = vb.split(' ').map(parseFloat);
+  if (parts.length !== 4) return null;
+  return {
+    x: parts[0],
+    y: parts[1],
+    width: parts[2],
+    height: parts[3]
+  };
+}
+
+// Default box used when a view has no drawable content, parsed once
+const DEFAULT_BOX = parseViewBox("0 0 100 100");
+
 /**
  * Helper function to combine two viewbox strings to create one that encompasses both
  * @param {string} viewBox1 - First viewBox string "x y width height"
@@ -121,29 +138,9 @@ export function processProjectionsForRendering(projections) {
  * @returns {string} Combined viewBox string
  */
 function combineViewBoxes(viewBox1, viewBox2) {
-  // Default empty viewBox
-  const defaultViewBox = "0 0 100 100";
-  
-  // Parse viewBox strings
-  const parseViewBox = (vb) => {
-    if (!vb) return null;
-    const parts = vb.split(' ').map(parseFloat);
-    if (parts.length !== 4) return null;
-    return {
-      x: parts[0],
-      y: parts[1],
-      width: parts[2],
-      height: parts[3]
-    };
-  };
-  
-  const box1 = parseViewBox(viewBox1) || parseViewBox(defaultViewBox);
-  const box2 = parseViewBox(viewBox2) || parseViewBox(defaultViewBox);
-  
-  // If both boxes are empty/invalid, return a default
-  if (!box1 && !box2) return defaultViewBox;
-  if (!box1) return viewBox2 || defaultViewBox;
-  if (!box2) return viewBox1 || defaultViewBox;
+  // Empty or invalid viewBoxes fall back to the default box
+  const box1 = parseViewBox(viewBox1) || DEFAULT_BOX;
+  const box2 = parseViewBox(viewBox2) || DEFAULT_BOX;
   
   // Find the combined bounds
   const minX = Math.min(box1.x, box2.x);
@@ -44,12 +44,13 @@ export function createHelperCuboid({
       })
     );
     
-    // Cut holes in the main model
+    // Cut holes in the main model (the XZ mirror is reused for the diagonal corner)
+    const drillXZ = mirror(drill, "XZ", mainCenter, true);
     const drilledModel = mainModel
       .cut(drill)
-      .cut(mirror(drill, "XZ", mainCenter, true))
+      .cut(drillXZ)
       .cut(mirror(drill, "YZ", mainCenter, true))
-      .cut(mirror(mirror(drill, "XZ", mainCenter, true), "YZ", mainCenter, true));
+      .cut(mirror(drillXZ, "YZ", mainCenter, true));
     
     // Create L-profile
     const lProfile = createLProfile({
@@ -99,7 +100,6 @@ export function createHelperCuboid({
   
   // If we end up with no models (small height), just return the helper space
   if (n_models <= 0) {
-    const helperSpace = createCuboid({ width, depth, height });
     return modelWithHelpers(compoundShapes([]), showHelper ? [helperSpace] : []);
   }
   
@@ -107,7 +107,8 @@ export function createHelperCuboid({
   const vertical_difference = height / (n_models + 1);
   const horizontal_difference = (n_models > 1) ? ((depth - 28) / (n_models - 1)) : 0;
 
-  // Calculate the model height for positioning
+  // The base model is identical for every position, so build it once and
+  // place clones of its parts; also use it for the model height
   const baseModelParts = createBaseModel();
   const modelHeight = baseModelParts.cuboid.boundingBox.bounds[1][2] - baseModelParts.cuboid.boundingBox.bounds[0][2];
   
@@ -121,15 +122,12 @@ export function createHelperCuboid({
   
   // Create and position all models
   for (let i = 0; i < n_models; i++) {
-    // Create new base model parts for each position
-    const modelParts = createBaseModel();
-    
     // Calculate explosion offsets
     const explodeX = explosionFactor * 15; // L-profile outward explosion
     
     // Position main cuboid without vertical explosion - keep it in place
     allParts.push(
-      modelParts.cuboid.clone().translate([
+      baseModelParts.cuboid.clone().translate([
         currentX, 
         currentY, 
         currentZ
@@ -138,7 +136,7 @@ export function createHelperCuboid({
     
     // Position L-profiles with outward explosion only
     allParts.push(
-      modelParts.lProfile1.clone().translate([
+      baseModelParts.lProfile1.clone().translate([
         currentX - explodeX, 
         currentY, 
         currentZ
@@ -146,7 +144,7 @@ export function createHelperCuboid({
     );
     
     allParts.push(
-      modelParts.lProfile2.clone().translate([
+      baseModelParts.lProfile2.clone().translate([
         currentX + explodeX, 
         currentY, 
         currentZ
@@ -25,12 +25,21 @@ export const modelRegistry = {
   "HelperCuboid": helperCuboidModel
 };
 
+// Default params per model definition, built once and shared (frozen, since
+// callers only ever copy them)
+const defaultParamsCache = new WeakMap();
+
 // Helper function to create object with default values
 export function createDefaultParams(model) {
-  return model.params.reduce((obj, param) => {
-    obj[param.name] = param.defaultValue;
-    return obj;
-  }, {});
+  let defaults = defaultParamsCache.get(model);
+  if (!defaults) {
+    defaults = Object.freeze(model.params.reduce((obj, param) => {
+      obj[param.name] = param.defaultValue;
+      return obj;
+    }, {}));
+    defaultParamsCache.set(model, defaults);
+  }
+  return defaults;
 }
 
 // Wrapper for model creation with validation
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef } from "react";
 import { wrap } from "comlink";
 
 import ThreeContext from "../ThreeContext.jsx";
@@ -8,50 +8,85 @@ import RenderingView from "../RenderingView.jsx";
 
 import cadWorker from "../worker.js?worker";
 import { modelRegistry, createDefaultParams } from "../models";
+import { perfTime, perfTimeEnd } from "../helpers/perf.js";
 
 const cad = wrap(new cadWorker());
 
+// Registered model names, in registry order
+const modelNames = Object.keys(modelRegistry);
+
+// Viewports narrower than 768px get the mobile layout (same test as
+// innerWidth < 768, including fractional widths when zoomed)
+const mobileQuery = window.matchMedia("not all and (min-width: 768px)");
+
+// Window in which rapid parameter edits (typing, slider drags) are coalesced
+// into a single worker request; the window opens on the first change and is
+// not extended by later ones
+const MESH_REQUEST_WINDOW_MS = 50;
+
 export default function CadApp() {
-  const [selectedModel, setSelectedModel] = useState(Object.keys(modelRegistry)[0]);
-  const [params, setParams] = useState(createDefaultParams(modelRegistry[selectedModel]));
+  const [selectedModel, setSelectedModel] = useState(modelNames[0]);
+  const [params, setParams] = useState(() => createDefaultParams(modelRegistry[modelNames[0]]));
   const [explosionFactor, setExplosionFactor] = useState(0);
   const [mesh, setMesh] = useState(null);
   const [projections, setProjections] = useState(null);
   const [validationErrors, setValidationErrors] = useState([]);
   const [activeTab, setActiveTab] = useState('3d');
-  const [controlsExpanded, setControlsExpanded] = useState(true);
-  const [isMobile, setIsMobile] = useState(false);
+  // Auto-collapse controls on mobile
+  const [controlsExpanded, setControlsExpanded] = useState(() => !mobileQuery.matches);
+  const [isMobile, setIsMobile] = useState(() => mobileQuery.matches);
   
-  // Detect mobile devices
+  // Detect mobile devices; only fires when the viewport crosses the breakpoint
   useEffect(() => {
-    const checkMobile = () => {
-      setIsMobile(window.innerWidth < 768);
-      // Auto-collapse controls on mobile
-      if (window.innerWidth < 768) {
-        setControlsExpanded(false);
-      } else {
-        setControlsExpanded(true);
-      }
+    const handleChange = (e) => {
+      setIsMobile(e.matches);
+      setControlsExpanded(!e.matches);
     };
     
-    checkMobile();
-    window.addEventListener('resize', checkMobile);
-    return () => window.removeEventListener('resize', checkMobile);
+    mobileQuery.addEventListener('change', handleChange);
+    return () => mobileQuery.removeEventListener('change', handleChange);
   }, []);
   
+  // Worker request coalescing: the latest inputs wait in pendingRequest until
+  // the window timer fires, and at most one request is in flight at a time
+  const pendingRequest = useRef(null);
+  const requestTimer = useRef(null);
+  const requestInFlight = useRef(false);
+  const currentModel = useRef(selectedModel);
+  const unmounted = useRef(false);
+  
   useEffect(() => {
-    setValidationErrors([]);
-    console.time(`[PERF] worker call for ${selectedModel}`);
-    console.log(`[INFO] Creating ${selectedModel} with params:`, params);
+    unmounted.current = false;
+    return () => {
+      unmounted.current = true;
+      clearTimeout(requestTimer.current);
+      requestTimer.current = null;
+    };
+  }, []);
+  
+  // Responses for a model that is no longer selected are dropped
+  const isStale = (model) => unmounted.current || model !== currentModel.current;
+  
+  const scheduleMeshRequest = () => {
+    if (requestTimer.current || requestInFlight.current) return;
+    requestTimer.current = setTimeout(sendMeshRequest, MESH_REQUEST_WINDOW_MS);
+  };
+  
+  const sendMeshRequest = () => {
+    requestTimer.current = null;
+    const { model, params: requestParams, modelParams, withProjections } = pendingRequest.current;
+    pendingRequest.current = null;
+    requestInFlight.current = true;
     
-    // If model supports explosion and we have an explosion factor, include it
-    const modelParams = { ...params };
-    if (modelRegistry[selectedModel].hasExplosion) {
-      modelParams.explosionFactor = explosionFactor;
+    setValidationErrors([]);
+    perfTime(`worker call for ${model}`);
+    if (import.meta.env.DEV) {
+      console.log(`[INFO] Creating ${model} with params:`, requestParams);
     }
     
-    cad.createMesh(selectedModel, modelParams).then(result => {
-      console.timeEnd(`[PERF] worker call for ${selectedModel}`);
+    const meshDone = cad.createMesh(model, modelParams).then(result => {
+      perfTimeEnd(`worker call for ${model}`);
+      if (isStale(model)) return;
       
       if (result.error && result.validationErrors) {
         setValidationErrors(result.validationErrors);
@@ -59,24 +94,45 @@ export default function CadApp() {
         setProjections(null);
       } else {
         setMesh(result);
-        
-        // Also generate technical drawings for the valid model
-        if (activeTab === 'technical') {
-          cad.createProjections(selectedModel, modelParams).then(projections => {
-            setProjections(projections);
-          });
-        }
       }
     });
+    
+    // Request technical drawings alongside the mesh instead of after it;
+    // the worker serves both from the same built model
+    const projectionsDone = withProjections
+      ? cad.createProjections(model, modelParams).then(projections => {
+          if (!isStale(model) && !projections.error) setProjections(projections);
+        })
+      : null;
+    
+    Promise.all([meshDone, projectionsDone]).finally(() => {
+      requestInFlight.current = false;
+      // Changes made while this request was in flight open the next window
+      if (pendingRequest.current && !unmounted.current) scheduleMeshRequest();
+    });
+  };
+  
+  useEffect(() => {
+    currentModel.current = selectedModel;
+    pendingRequest.current = {
+      model: selectedModel,
+      params,
+      // If model supports explosion, include the explosion factor; otherwise
+      // params can be sent as-is without copying
+      modelParams: modelRegistry[selectedModel].hasExplosion
+        ? { ...params, explosionFactor }
+        : params,
+      withProjections: activeTab === 'technical'
+    };
+    scheduleMeshRequest();
   }, [selectedModel, params, explosionFactor]);
   
   // When tab changes, generate the required view data
   useEffect(() => {
     if (activeTab === 'technical' && mesh && !projections) {
-      const modelParams = { ...params };
-      if (modelRegistry[selectedModel].hasExplosion) {
-        modelParams.explosionFactor = explosionFactor;
-      }
+      const modelParams = modelRegistry[selectedModel].hasExplosion
+        ? { ...params, explosionFactor }
+        : params;
       
       cad.createProjections(selectedModel, modelParams).then(projections => {
         setProjections(projections);
@@ -100,7 +156,7 @@ export default function CadApp() {
   };
   
   const handleExplosionChange = (e) => {
-    setExplosionFactor(parseFloat(e.target.value));
+    setExplosionFactor(e.target.valueAsNumber);
   };
   
   const toggleControls = () => {
@@ -141,7 +197,7 @@ export default function CadApp() {
                 flex: isMobile ? "1" : "auto"
               }}
             >
-              {Object.keys(modelRegistry).map(model => (
+              {modelNames.map(model => (
                 <option key={model} value={model}>{model}</option>
               ))}
             </select>
@@ -312,7 +368,7 @@ export default function CadApp() {
                     id={`param-${name}`}
                     type="number"
                     value={value}
-                    onChange={(e) => handleParamChange(name, parseFloat(e.target.value))}
+                    onChange={(e) => handleParamChange(name, e.target.valueAsNumber)}
                     style={{ 
                       width: isMobile ? "calc(100% - 50px)" : "60px", 
                       height: isMobile ? "30px" : "20px", 
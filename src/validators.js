@@ -1,3 +1,7 @@
+// Shared results for passing checks; callers only read them
+const VALID = Object.freeze({ valid: true });
+const VALID_NO_ERRORS = Object.freeze({ valid: true, errors: Object.freeze([]) });
+
 export function isNumber(value, param) {
   if (typeof value !== 'number' || isNaN(value)) {
     return {
@@ -5,7 +9,7 @@ export function isNumber(value, param) {
       message: `Parameter '${param}' must be a number`
     };
   }
-  return { valid: true };
+  return VALID;
 }
 
 export function isGreaterThanZero(value, param) {
@@ -15,7 +19,7 @@ export function isGreaterThanZero(value, param) {
       message: `Parameter '${param}' must be positive`
     };
   }
-  return { valid: true };
+  return VALID;
 }
 
 export function isLessThan(value, compareValue, param) {
@@ -25,7 +29,7 @@ export function isLessThan(value, compareValue, param) {
       message: `${param} (${value}) must be less than ${compareValue}`
     };
   }
-  return { valid: true };
+  return VALID;
 }
 
 // Composed validators
@@ -68,7 +72,7 @@ export function validateLessThan(smallerParam, largerParam) {
         errors: [result.message]
       };
     }
-    return { valid: true, errors: [] };
+    return VALID_NO_ERRORS;
   };
 }
 
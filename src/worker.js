@@ -6,6 +6,7 @@ import { expose } from "comlink";
 // Import our model registry
 import { modelRegistry, createModelWithValidation } from "./models";
 import { createOrthographicProjections, processProjectionsForRendering } from "./helpers/technicalDrawing.js";
+import { perfTime, perfTimeEnd } from "./helpers/perf.js";
 
 // Initialize OpenCascade
 let loaded = false;
@@ -23,15 +24,33 @@ const init = async () => {
 };
 const started = init();
 
+// Last built model, reused while the same model and params are requested
+// again (e.g. createProjections right after createMesh)
+let lastBuilt = { key: null, result: null };
+
+function buildModel(modelName, params) {
+  const model = modelRegistry[modelName];
+  // Unknown models are left to createModelWithValidation to report
+  if (!model) return createModelWithValidation(modelName, params);
+  
+  // Key on values in the model's registered param order, so the key is
+  // canonical regardless of how the incoming params object was built
+  const key = `${modelName}:${model.params.map(({ name }) => params[name]).join("|")}`;
+  if (lastBuilt.key !== key) {
+    lastBuilt = { key, result: createModelWithValidation(modelName, params) };
+  }
+  return lastBuilt.result;
+}
+
 // Generic function to create a mesh for any model
 function createMesh(modelName, params) {
-  console.time(`[PERF] Total ${modelName} creation`);
+  perfTime(`Total ${modelName} creation`);
   
   return started.then(() => {
-    console.time(`[PERF] ${modelName} model function`);
+    perfTime(`${modelName} model function`);
     // Use the new validation and creation function
-    const result = createModelWithValidation(modelName, params);
-    console.timeEnd(`[PERF] ${modelName} model function`);
+    const result = buildModel(modelName, params);
+    perfTimeEnd(`${modelName} model function`);
     
     // Check if validation failed
     if (result && result.error) {
@@ -54,22 +73,22 @@ function createMesh(modelName, params) {
       };
       
       // Generate main model mesh
-      console.time(`[PERF] ${modelName} main model generation`);
+      perfTime(`${modelName} main model generation`);
       const faces = mainModel.mesh(meshOptions);
       const edges = mainModel.meshEdges(meshOptions);
-      console.timeEnd(`[PERF] ${modelName} main model generation`);
+      perfTimeEnd(`${modelName} main model generation`);
       
       // Generate helper spaces meshes
-      console.time(`[PERF] ${modelName} helper spaces generation`);
+      perfTime(`${modelName} helper spaces generation`);
       const helperMeshes = helperSpaces.map(helper => {
         return {
           faces: helper.mesh(meshOptions),
           edges: helper.meshEdges(meshOptions)
         };
       });
-      console.timeEnd(`[PERF] ${modelName} helper spaces generation`);
+      perfTimeEnd(`${modelName} helper spaces generation`);
       
-      console.timeEnd(`[PERF] Total ${modelName} creation`);
+      perfTimeEnd(`Total ${modelName} creation`);
       
       // Return both main model and helper spaces
       return {
@@ -87,19 +106,19 @@ function createMesh(modelName, params) {
     };
     
     // Generate and time mesh operations
-    console.time(`[PERF] ${modelName} faces generation`);
+    perfTime(`${modelName} faces generation`);
     const faces = result.mesh(meshOptions);
-    console.timeEnd(`[PERF] ${modelName} faces generation`);
+    perfTimeEnd(`${modelName} faces generation`);
     
-    if (faces && faces.triangles) {
+    if (import.meta.env.DEV && faces && faces.triangles) {
       console.log(`[INFO] ${modelName} triangles: ${faces.triangles.length/3}, vertices: ${faces.vertices.length/3}`);
     }
     
-    console.time(`[PERF] ${modelName} edges generation`);
+    perfTime(`${modelName} edges generation`);
     const edges = result.meshEdges(meshOptions);
-    console.timeEnd(`[PERF] ${modelName} edges generation`);
+    perfTimeEnd(`${modelName} edges generation`);
     
-    console.timeEnd(`[PERF] Total ${modelName} creation`);
+    perfTimeEnd(`Total ${modelName} creation`);
     
     // Return the mesh data
     return {
@@ -111,11 +130,11 @@ function createMesh(modelName, params) {
 
 // Function to create orthographic projections for technical drawings
 function createProjections(modelName, params) {
-  console.time(`[PERF] Total ${modelName} projections creation`);
+  perfTime(`Total ${modelName} projections creation`);
   
   return started.then(() => {
     // Use the new validation and creation function
-    const result = createModelWithValidation(modelName, params);
+    const result = buildModel(modelName, params);
     
     // Check if validation failed
     if (result && result.error) {
@@ -126,16 +145,16 @@ function createProjections(modelName, params) {
     }
     
     // Create orthographic projections
-    console.time(`[PERF] ${modelName} projections generation`);
+    perfTime(`${modelName} projections generation`);
     const projections = createOrthographicProjections(result);
-    console.timeEnd(`[PERF] ${modelName} projections generation`);
+    perfTimeEnd(`${modelName} projections generation`);
     
     // Process projections for rendering
-    console.time(`[PERF] ${modelName} projections processing`);
+    perfTime(`${modelName} projections processing`);
     const processedProjections = processProjectionsForRendering(projections);
-    console.timeEnd(`[PERF] ${modelName} projections processing`);
+    perfTimeEnd(`${modelName} projections processing`);
     
-    console.timeEnd(`[PERF] Total ${modelName} projections creation`);
+    perfTimeEnd(`Total ${modelName} projections creation`);
     
     return processedProjections;
   });
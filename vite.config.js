@@ -7,6 +7,17 @@ export default defineConfig({
   base: '/cad-os/', 
   build: {
     outDir: "build",
+    rollupOptions: {
+      output: {
+        // Keep large, rarely-changing dependencies in their own hashed chunks
+        // so app-only deploys don't invalidate them in browser caches
+        manualChunks: {
+          react: ["react", "react-dom"],
+          three: ["three", "@react-three/fiber", "@react-three/drei"],
+          replicad: ["replicad", "replicad-threejs-helper"],
+        },
+      },
+    },
   },
   server: {
     port: 4444,